@@ -1,7 +1,25 @@
-import json
 import os
 import re
 
+import orjson
+
+_MASTER_RE = re.compile(r"^(Master)\s*\d+$", re.IGNORECASE)
+
+
+def _format_scene_name(name, dungeon_type):
+    if name.lower() == "content mechanism test scene":
+        name = "Overworld"
+
+    # Append DungeonTypeName if it exists and is a short string (likely a difficulty)
+    if dungeon_type and len(dungeon_type) < 50 and "<br>" not in dungeon_type:
+        # Normalize 'Master 1', 'Master 2' -> 'Master'
+        m = _MASTER_RE.match(dungeon_type.strip())
+        normalized = m.group(1).title() if m else dungeon_type
+        name = f"{name} - {normalized}"
+
+    return name
+
+
 def create_dungeon_name_mapping():
     """
     Extracts SceneID and Name from DungeonsTable.json and creates a mapping
@@ -13,41 +31,22 @@ def create_dungeon_name_mapping():
     output_path = os.path.join(script_dir, "../../src-tauri/meter-data/SceneName.json")
 
     # Load the DungeonsTable.json
-    with open(input_path, "r", encoding="utf-8") as f:
-        dungeons_data = json.load(f)
+    with open(input_path, "rb") as f:
+        dungeons_data = orjson.loads(f.read())
 
     # Create the mapping: SceneID -> Name
-    scene_name_mapping = {}
-
-    for dungeon_id, dungeon_info in dungeons_data.items():
-        scene_id = str(dungeon_info.get("SceneID", ""))
-        name = dungeon_info.get("Name", "")
-
-        if name.lower() == "content mechanism test scene":
-            name = "Overworld"
-
-        dungeon_type = dungeon_info.get("DungeonTypeName", "")
-
-        if scene_id and name:
-            # Append DungeonTypeName if it exists and is a short string (likely a difficulty)
-            if dungeon_type and len(dungeon_type) < 50 and "<br>" not in dungeon_type:
-                # Normalize 'Master 1', 'Master 2' -> 'Master'
-                m = re.match(r"^(Master)\s*\d+$", dungeon_type.strip(), re.IGNORECASE)
-                if m:
-                    normalized = m.group(1).title()
-                else:
-                    normalized = dungeon_type
-
-                name = f"{name} - {normalized}"
-
-            scene_name_mapping[scene_id] = name
+    scene_name_mapping = {
+        scene_id: _format_scene_name(name, dungeon_info.get("DungeonTypeName", ""))
+        for dungeon_info in dungeons_data.values()
+        if (scene_id := str(dungeon_info.get("SceneID", ""))) and (name := dungeon_info.get("Name", ""))
+    }
 
     # Ensure output directory exists
     os.makedirs(os.path.dirname(output_path), exist_ok=True)
 
     # Write the mapping to the output file
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(scene_name_mapping, f, ensure_ascii=False, indent=4)
+    with open(output_path, "wb") as f:
+        f.write(orjson.dumps(scene_name_mapping, option=orjson.OPT_INDENT_2))
 
     print(f"✅ Created SceneName.json with {len(scene_name_mapping)} mappings")
     print(f"Output saved to: {output_path}")
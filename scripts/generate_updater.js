@@ -22,11 +22,12 @@ const pub_date = new Date().toISOString();
 function findFiles(dir) {
     let results = [];
     if (!fs.existsSync(dir)) return results;
-    const list = fs.readdirSync(dir);
-    list.forEach(file => {
-        file = path.join(dir, file);
-        const stat = fs.statSync(file);
-        if (stat && stat.isDirectory()) {
+    // withFileTypes gives us the entry kind from the directory read itself,
+    // so we don't need a separate stat() per file.
+    const list = fs.readdirSync(dir, { withFileTypes: true });
+    list.forEach(entry => {
+        const file = path.join(dir, entry.name);
+        if (entry.isDirectory()) {
             results = results.concat(findFiles(file));
         } else {
             results.push(file);
@@ -82,5 +83,9 @@ const updateData = {
     platforms
 };
 
-fs.writeFileSync(outputFile, JSON.stringify(updateData, null, 2));
+// Write to a temp file and rename over the target so readers never see a
+// partially written manifest.
+const tmpFile = outputFile + '.tmp';
+fs.writeFileSync(tmpFile, JSON.stringify(updateData, null, 2));
+fs.renameSync(tmpFile, outputFile);
 console.log(`Generated ${outputFile}`);
@@ -10,29 +10,65 @@ import html
 import re
 from datetime import datetime
 
-try:
-    from bs4 import BeautifulSoup
-except Exception as e:
-    print("BeautifulSoup (bs4) is required. Install with: pip install beautifulsoup4", file=sys.stderr)
-    raise
-
 
 UPDATER = os.environ.get('UPDATER_PATH', 'public/updater.json')
 INDEX = os.environ.get('INDEX_PATH', 'public/index.html')
 
 
+def _element_re(elem_id: str) -> re.Pattern:
+    # groups: 1 = opening tag, 2 = tag name, 3 = inner html, 4 = closing tag
+    return re.compile(
+        r'(<([a-zA-Z][\w-]*)\b[^>]*\bid=["\']' + re.escape(elem_id) + r'["\'][^>]*>)(.*?)(</\2\s*>)',
+        re.S,
+    )
+
+
+def _open_tag_re(elem_id: str) -> re.Pattern:
+    return re.compile(r'<[a-zA-Z][\w-]*\b[^>]*\bid=["\']' + re.escape(elem_id) + r'["\'][^>]*>')
+
+
+_DL_RE = _element_re('download-latest')
+_INFO_RE = _element_re('latest-info')
+_CLIST_RE = _element_re('changelog-list')
+_LOADING_RE = _open_tag_re('changelog-loading')
+
+_PARA_RE = re.compile(r'\n\s*\n')
+_INLINE_RE = re.compile(r'\[([^\]]+)\]\((https?://[^)]+)\)|\n')
+
+
+def _drop_attr(tag: str, name: str) -> str:
+    attr_re = r'\s' + re.escape(name) + r'(?:\s*=\s*(?:"[^"]*"|\'[^\']*\'|[^\s>]+))?(?=[\s/>])'
+    return re.sub(attr_re, '', tag, count=1)
+
+
+def _set_attr(tag: str, name: str, value: str) -> str:
+    tag = _drop_attr(tag, name)
+    attr = f' {name}="{html.escape(value)}"'
+    return re.sub(r'\s*(/?>)$', lambda m: attr + m.group(1), tag, count=1)
+
+
+def _inline_to_html(p: str) -> str:
+    # single pass over the paragraph: escape plain runs, convert Markdown-like
+    # links [text](url) -> <a href="url">text</a> and newlines -> <br/>
+    out = []
+    pos = 0
+    for m in _INLINE_RE.finditer(p):
+        out.append(html.escape(p[pos:m.start()]))
+        if m.group(1) is None:
+            out.append('<br/>')
+        else:
+            text = html.escape(m.group(1)).replace('\n', '<br/>')
+            out.append(f'<a href="{html.escape(m.group(2))}">{text}</a>')
+        pos = m.end()
+    out.append(html.escape(p[pos:]))
+    return ''.join(out)
+
+
 def notes_to_html(txt: str) -> str:
     t = txt.replace('\r\n', '\n').strip()
     if not t:
         return '<em>No release notes provided.</em>'
-    paras = [p.strip() for p in re.split(r'\n\s*\n', t)]
-    out = []
-    for p in paras:
-        # convert Markdown-like links [text](url) -> <a href="url">text</a>
-        p = re.sub(r'\[([^\]]+)\]\((https?://[^)]+)\)', r'<a href="\2">\1</a>', html.escape(p))
-        p = p.replace('\n', '<br/>')
-        out.append(f'<p>{p}</p>')
-    return ''.join(out)
+    return ''.join(f'<p>{_inline_to_html(p.strip())}</p>' for p in _PARA_RE.split(t))
 
 
 def format_date(iso: str) -> str:
@@ -79,66 +115,36 @@ def main():
         return 1
 
     with open(INDEX, 'r', encoding='utf-8') as f:
-        original = f.read()
-
-    # preserve doctype if present at top
-    doctype_match = re.match(r'(?is)(<!doctype[^>]*>\s*)', original)
-    doctype = doctype_match.group(1) if doctype_match else ''
-
-    soup = BeautifulSoup(original, 'html.parser')
+        out = f.read()
 
     # Update download link/button
-    dl = soup.find(id='download-latest')
-    if dl and url:
-        dl['href'] = url
-        if version:
-            dl.string = f'Download Latest ({version})'
-        else:
-            dl.string = 'Download Latest'
-        if 'download' in dl.attrs and url.startswith('http'):
-            del dl.attrs['download']
+    if url:
+        def _sub_download(m: re.Match) -> str:
+            tag = _set_attr(m.group(1), 'href', url)
+            if url.startswith('http'):
+                tag = _drop_attr(tag, 'download')
+            text = f'Download Latest ({version})' if version else 'Download Latest'
+            return tag + html.escape(text) + m.group(4)
+
+        out = _DL_RE.sub(_sub_download, out, count=1)
 
     # Update latest info
-    info = soup.find(id='latest-info')
-    if info is not None:
-        info.clear()
-        header_html = f"<strong>Latest: {html.escape(version)}</strong> — released {html.escape(pretty_date)}"
-        content_html = header_html + '<br/><br/>' + '<strong>Release notes:</strong>' + notes_html + '<br/>' + '<strong>Signature:</strong>' + f"<pre class='signature' style='white-space:pre-wrap;background:rgba(255,255,255,0.02);padding:8px;border-radius:6px'>{html.escape(signature)}</pre>"
-        info.append(BeautifulSoup(content_html, 'html.parser'))
+    header_html = f"<strong>Latest: {html.escape(version)}</strong> — released {html.escape(pretty_date)}"
+    content_html = header_html + '<br/><br/>' + '<strong>Release notes:</strong>' + notes_html + '<br/>' + '<strong>Signature:</strong>' + f"<pre class='signature' style='white-space:pre-wrap;background:rgba(255,255,255,0.02);padding:8px;border-radius:6px'>{html.escape(signature)}</pre>"
+    out = _INFO_RE.sub(lambda m: m.group(1) + content_html + m.group(4), out, count=1)
 
     # Populate changelog-list with single entry
-    clist = soup.find(id='changelog-list')
-    if clist is not None:
-        clist.clear()
-        li = soup.new_tag('li', **{'class': 'release'})
-        left = soup.new_tag('div')
-        title = soup.new_tag('div')
-        title.append(BeautifulSoup(f"<strong>{html.escape(version)}</strong> <span class='meta'>{html.escape(pretty_date)}</span>", 'html.parser'))
-        notes_div = soup.new_tag('div', **{'class': 'meta'})
-        notes_div.append(BeautifulSoup(notes_html, 'html.parser'))
-        left.append(title)
-        left.append(notes_div)
-
-        right = soup.new_tag('div')
-        dlk = soup.new_tag('a', **{'class': 'button', 'href': url or '#'})
-        dlk.string = 'Download'
-        if url and url.startswith('/'):
-            dlk['download'] = ''
-        right.append(dlk)
-
-        li.append(left)
-        li.append(right)
-        clist.append(li)
-
-        loading = soup.find(id='changelog-loading')
-        if loading is not None:
-            loading['hidden'] = 'true'
-        if 'hidden' in clist.attrs:
-            del clist.attrs['hidden']
-
-    out = str(soup)
-    if doctype and not out.lower().lstrip().startswith('<!doctype'):
-        out = doctype + out
+    download_attr = ' download=""' if url and url.startswith('/') else ''
+    li_html = (
+        '<li class="release">'
+        f"<div><div><strong>{html.escape(version)}</strong> <span class='meta'>{html.escape(pretty_date)}</span></div>"
+        f'<div class="meta">{notes_html}</div></div>'
+        f'<div><a class="button" href="{html.escape(url or "#")}"{download_attr}>Download</a></div>'
+        '</li>'
+    )
+    out, replaced = _CLIST_RE.subn(lambda m: _drop_attr(m.group(1), 'hidden') + li_html + m.group(4), out, count=1)
+    if replaced:
+        out = _LOADING_RE.sub(lambda m: _set_attr(m.group(0), 'hidden', 'true'), out, count=1)
 
     with open(INDEX, 'w', encoding='utf-8') as f:
         f.write(out)